@@ -43,6 +43,7 @@ class BaseFilterModel(BaseModel, extra="forbid"):
         model: type
         ordering_field_name: str = "order_by"
         search_model_fields: list[str]
+        search_model_columns: list[Any]
         search_field_name: str = "search"
         prefix: str
         original_filter: type["BaseFilterModel"]
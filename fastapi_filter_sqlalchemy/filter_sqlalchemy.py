@@ -90,6 +90,7 @@ class Filter(BaseFilterModel):
         model: type
         ordering_field_name: str = "order_by"
         search_model_fields: list[str]
+        search_model_columns: list[typing.Any]
         search_field_name: str = "search"
         prefix: str
         original_filter: type["Filter"]
@@ -147,12 +148,11 @@ class Filter(BaseFilterModel):
             else:
                 operator = "__eq__"
 
-            if field_name == self.Constants.search_field_name and hasattr(self.Constants, "search_model_fields"):
-                search_filters = [
-                    getattr(self.Constants.model, field).ilike(f"%{value}%")
-                    for field in self.Constants.search_model_fields
-                ]
-                query = query.filter(or_(*search_filters))
+            if (
+                field_name == self.Constants.search_field_name
+                and (search_columns := self._search_model_columns()) is not None
+            ):
+                query = query.filter(or_(*[column.ilike(f"%{value}%") for column in search_columns]))
             else:
                 query = self._custom_filter_field(
                     query=query, operator=operator, field_name=field_name, value=value, to_date=to_date
@@ -160,6 +160,24 @@ class Filter(BaseFilterModel):
 
         return query
 
+    def _search_model_columns(self) -> list[typing.Any] | None:
+        """Return the columns used by the search field, or None if search is not configured.
+
+        The most derived `Constants` class declaring `search_model_columns` or `search_model_fields` wins, so a
+        subclass can override the search configuration inherited from its parent with either attribute. If a single
+        class declares both, `search_model_columns` is used.
+
+        Only `search_model_columns` is used as is; names from `search_model_fields` are still looked up on the model
+        on every call.
+        """
+        for constants in self.Constants.__mro__:
+            namespace = vars(constants)
+            if "search_model_columns" in namespace:
+                return namespace["search_model_columns"]
+            if "search_model_fields" in namespace:
+                return [getattr(self.Constants.model, field) for field in namespace["search_model_fields"]]
+        return None
+
     def _custom_filter_field(
         self, query: Query | Select, operator: str, field_name: str, value: typing.Any, to_date: bool = False
     ) -> Query | Select:
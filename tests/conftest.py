@@ -1,26 +1,44 @@
 from collections.abc import AsyncIterator
 from datetime import datetime
+from types import SimpleNamespace
+from typing import ClassVar
 
 import pytest
 import pytest_asyncio
 from fastapi import Depends, FastAPI, Query
 from httpx import ASGITransport, AsyncClient
 from pydantic import BaseModel, ConfigDict, Field, field_validator
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, or_, select
+from pytest_asyncio import is_async_test
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, bindparam, event, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import Mapped, declarative_base, relationship
+from sqlalchemy.orm import Mapped, configure_mappers, contains_eager, declarative_base, relationship, selectinload
+from sqlalchemy.pool import StaticPool
 
 from fastapi_filter_sqlalchemy import Filter as SQLAlchemyFilter
 from fastapi_filter_sqlalchemy import FilterDepends, with_prefix
 
 
-@pytest_asyncio.fixture(scope="function")
-async def test_client(app):
-    async with AsyncClient(base_url="http://test", transport=ASGITransport(app=app)) as async_test_client:
+def pytest_collection_modifyitems(items):
+    # The engine and the connection holding the test transaction are session-scoped, so every async test has to run
+    # in the same event loop.
+    session_loop_marker = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop_marker, append=False)
+
+
+@pytest.fixture(scope="session")
+def transport(app):
+    return ASGITransport(app=app)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def test_client(transport):
+    async with AsyncClient(base_url="http://test", transport=transport) as async_test_client:
         yield async_test_client
 
 
-@pytest.fixture(scope="package")
+@pytest.fixture(scope="session")
 def UserFilterOrderByWithDefault(User, UserFilter):  # type: ignore[valid-type]
     class UserFilterOrderByWithDefault(UserFilter):  # type: ignore
         order_by: list[str] = ["age"]
@@ -28,7 +46,7 @@ def UserFilterOrderByWithDefault(User, UserFilter):  # type: ignore[valid-type]
     return UserFilterOrderByWithDefault
 
 
-@pytest.fixture(scope="package")
+@pytest.fixture(scope="session")
 def UserFilterOrderBy(User, UserFilter):  # type: ignore[valid-type]
     class UserFilterOrderBy(UserFilter):  # type: ignore
         order_by: list[str] | None = None
@@ -36,12 +54,12 @@ def UserFilterOrderBy(User, UserFilter):  # type: ignore[valid-type]
     return UserFilterOrderBy
 
 
-@pytest.fixture(scope="package")
+@pytest.fixture(scope="session")
 def UserFilterNoOrderBy(User, UserFilter):  # type: ignore[valid-type]
     return UserFilter
 
 
-@pytest.fixture(scope="package")
+@pytest.fixture(scope="session")
 def UserFilterCustomOrderBy(UserFilter):  # type: ignore[valid-type]
     class UserFilterCustomOrderBy(UserFilter):  # type: ignore
         class Constants(UserFilter.Constants):  # type: ignore[name-defined]
@@ -52,9 +70,11 @@ def UserFilterCustomOrderBy(UserFilter):  # type: ignore[valid-type]
     return UserFilterCustomOrderBy
 
 
-@pytest.fixture(scope="package")
+@pytest.fixture(scope="session")
 def UserFilterRestrictedOrderBy(UserFilter):  # type: ignore[valid-type]
     class UserFilterRestrictedOrderBy(UserFilter):  # type: ignore
+        _ALLOWED: ClassVar[frozenset[str]] = frozenset({"age", "created_at"})
+
         order_by: list[str] | None = None
 
         @field_validator("order_by")
@@ -62,12 +82,9 @@ def UserFilterRestrictedOrderBy(UserFilter):  # type: ignore[valid-type]
             if not value:
                 return None
 
-            allowed_field_names = ["age", "created_at"]
             for field_name in value:
-                field_name = field_name.replace("-", "").replace("+", "")
-
-                if field_name not in allowed_field_names:
-                    raise ValueError(f"You may only sort by: {', '.join(allowed_field_names)}")
+                if field_name.replace("-", "").replace("+", "") not in cls._ALLOWED:
+                    raise ValueError(f"You may only sort by: {', '.join(sorted(cls._ALLOWED))}")
 
             return value
 
@@ -75,46 +92,94 @@ def UserFilterRestrictedOrderBy(UserFilter):  # type: ignore[valid-type]
 
 
 @pytest.fixture(scope="session")
-def sqlite_file_path(tmp_path_factory):
-    file_path = tmp_path_factory.mktemp("data") / "fastapi_filter_test.sqlite"
-    yield file_path
-
-
-@pytest.fixture(scope="session")
-def database_url(sqlite_file_path) -> str:
-    return f"sqlite+aiosqlite:///{sqlite_file_path}"
+def database_url() -> str:
+    return "sqlite+aiosqlite:///file:fastapi_filter_test?mode=memory&cache=shared&uri=true"
 
 
 @pytest.fixture(scope="session")
 def engine(database_url):
-    return create_async_engine(database_url)
+    engine = create_async_engine(database_url, connect_args={"uri": True}, poolclass=StaticPool)
 
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_con, connection_record):
+        cursor = dbapi_con.cursor()
+        cursor.execute("PRAGMA synchronous=OFF;")
+        cursor.execute("PRAGMA journal_mode=MEMORY;")
+        cursor.execute("PRAGMA temp_store=MEMORY;")
+        cursor.execute("PRAGMA locking_mode=EXCLUSIVE;")
+        cursor.execute("PRAGMA cache_size=-20000;")
+        cursor.close()
 
-@pytest.fixture(scope="session")
-def SessionLocal(engine):
-    return async_sessionmaker(engine, autoflush=True, class_=AsyncSession)
+    return engine
 
 
-@pytest_asyncio.fixture(scope="function")
-async def session(engine, SessionLocal, Base):
+@pytest_asyncio.fixture(scope="session")
+async def tables_created(engine, Base, models):
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
         await conn.run_sync(Base.metadata.create_all)
 
-    async with SessionLocal() as session:
-        yield session
+    yield
 
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
 
 
+@pytest_asyncio.fixture(scope="session")
+async def connection(engine, tables_created):
+    async with engine.connect() as conn:
+        await conn.begin()
+        yield conn
+        await conn.rollback()
+
+
+@pytest.fixture(scope="session")
+def SessionLocal(connection):
+    return async_sessionmaker(
+        connection,
+        autoflush=False,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+        class_=AsyncSession,
+    )
+
+
+@pytest_asyncio.fixture(scope="function")
+async def session(connection, SessionLocal):
+    savepoint = await connection.begin_nested()
+    async with SessionLocal() as session:
+        yield session
+    await savepoint.rollback()
+
+
 @pytest.fixture(scope="session")
 def Base():
     return declarative_base()
 
 
 @pytest.fixture(scope="session")
-def User(Base, Address, FavoriteSport, Sport):
+def models(Base):
+    class Address(Base):  # type: ignore[misc, valid-type]
+        __tablename__ = "addresses"
+
+        id = Column(Integer, primary_key=True, autoincrement=True)
+        street = Column(String, nullable=True)
+        city = Column(String, nullable=False)
+        country = Column(String, nullable=False)
+
+    class Sport(Base):  # type: ignore[misc, valid-type]
+        __tablename__ = "sports"
+
+        id = Column(Integer, primary_key=True, autoincrement=True)
+        name = Column(String, nullable=False)
+        is_individual = Column(Boolean, nullable=False)
+
+    class FavoriteSport(Base):  # type: ignore[misc, valid-type]
+        __tablename__ = "favorite_sports"
+
+        user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+        sport_id = Column(Integer, ForeignKey("sports.id"), primary_key=True)
+
     class User(Base):  # type: ignore[misc, valid-type]
         __tablename__ = "users"
 
@@ -125,55 +190,40 @@ def User(Base, Address, FavoriteSport, Sport):
         age = Column(Integer, nullable=False)
         code = Column(String)
         address_id = Column(Integer, ForeignKey("addresses.id"))
-        address: Mapped[Address] = relationship(Address, backref="users", lazy="joined")  # type: ignore[valid-type]
-        favorite_sports: Mapped[Sport] = relationship(  # type: ignore[valid-type]
+        address: Mapped[Address] = relationship(Address, backref="users")
+        favorite_sports: Mapped[list[Sport]] = relationship(
             Sport,
             secondary="favorite_sports",
             backref="users",
-            lazy="joined",
         )
 
-    return User
+    configure_mappers()
 
-
-@pytest.fixture(scope="session")
-def Address(Base):
-    class Address(Base):  # type: ignore[misc, valid-type]
-        __tablename__ = "addresses"
-
-        id = Column(Integer, primary_key=True, autoincrement=True)
-        street = Column(String, nullable=True)
-        city = Column(String, nullable=False)
-        country = Column(String, nullable=False)
-
-    return Address
+    return SimpleNamespace(User=User, Address=Address, Sport=Sport, FavoriteSport=FavoriteSport)
 
 
 @pytest.fixture(scope="session")
-def Sport(Base):
-    class Sport(Base):  # type: ignore[misc, valid-type]
-        __tablename__ = "sports"
+def User(models):
+    return models.User
 
-        id = Column(Integer, primary_key=True, autoincrement=True)
-        name = Column(String, nullable=False)
-        is_individual = Column(Boolean, nullable=False)
 
-    return Sport
+@pytest.fixture(scope="session")
+def Address(models):
+    return models.Address
 
 
 @pytest.fixture(scope="session")
-def FavoriteSport(Base):
-    class FavoriteSport(Base):  # type: ignore[misc, valid-type]
-        __tablename__ = "favorite_sports"
+def Sport(models):
+    return models.Sport
 
-        user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
-        sport_id = Column(Integer, ForeignKey("sports.id"), primary_key=True)
 
-    return FavoriteSport
+@pytest.fixture(scope="session")
+def FavoriteSport(models):
+    return models.FavoriteSport
 
 
-@pytest_asyncio.fixture(scope="function")
-async def users(session, User, Address):
+@pytest_asyncio.fixture(scope="session")
+async def seed_data(SessionLocal, User, Address, Sport, FavoriteSport):
     user_instances = [
         User(
             name=None,
@@ -216,13 +266,6 @@ async def users(session, User, Address):
             code="89",
         ),
     ]
-    session.add_all(user_instances)
-    await session.commit()
-    yield user_instances
-
-
-@pytest_asyncio.fixture(scope="function")
-async def sports(session, Sport):
     sport_instances = [
         Sport(
             name="Ice Hockey",
@@ -233,37 +276,37 @@ async def sports(session, Sport):
             is_individual=True,
         ),
     ]
-    session.add_all(sport_instances)
-    await session.commit()
-    yield sports
 
+    async with SessionLocal() as seed_session, seed_session.begin():
+        seed_session.add_all([*user_instances, *sport_instances])
+        await seed_session.flush()
+        favorite_sport_rows = [
+            {"user_id": user_instances[0].id, "sport_id": sport_instances[0].id},
+            {"user_id": user_instances[0].id, "sport_id": sport_instances[1].id},
+            {"user_id": user_instances[1].id, "sport_id": sport_instances[0].id},
+            {"user_id": user_instances[2].id, "sport_id": sport_instances[1].id},
+        ]
+        await seed_session.execute(FavoriteSport.__table__.insert(), favorite_sport_rows)
 
-@pytest_asyncio.fixture(scope="function")
-async def favorite_sports(session, sports, users, FavoriteSport):
-    favorite_sport_instances = [
-        FavoriteSport(
-            user_id=users[0].id,
-            sport_id=sports[0].id,
-        ),
-        FavoriteSport(
-            user_id=users[0].id,
-            sport_id=sports[1].id,
-        ),
-        FavoriteSport(
-            user_id=users[1].id,
-            sport_id=sports[0].id,
-        ),
-        FavoriteSport(
-            user_id=users[2].id,
-            sport_id=sports[1].id,
-        ),
-    ]
-    session.add_all(favorite_sport_instances)
-    await session.commit()
-    yield favorite_sport_instances
+    yield SimpleNamespace(users=user_instances, sports=sport_instances, favorite_sports=favorite_sport_rows)
+
+
+@pytest.fixture(scope="session")
+def users(seed_data):
+    return seed_data.users
+
+
+@pytest.fixture(scope="session")
+def sports(seed_data):
+    return seed_data.sports
 
 
-@pytest.fixture(scope="package")
+@pytest.fixture(scope="session")
+def favorite_sports(seed_data):
+    return seed_data.favorite_sports
+
+
+@pytest.fixture(scope="session")
 def AddressOut():
     class AddressOut(BaseModel):
         model_config = ConfigDict(from_attributes=True)
@@ -276,7 +319,7 @@ def AddressOut():
     return AddressOut
 
 
-@pytest.fixture(scope="package")
+@pytest.fixture(scope="session")
 def UserOut(AddressOut, SportOut):
     class UserOut(BaseModel):
         model_config = ConfigDict(from_attributes=True)
@@ -292,7 +335,7 @@ def UserOut(AddressOut, SportOut):
     return UserOut
 
 
-@pytest.fixture(scope="package")
+@pytest.fixture(scope="session")
 def SportOut():
     class SportOut(BaseModel):
         model_config = ConfigDict(from_attributes=True)
@@ -304,12 +347,12 @@ def SportOut():
     return SportOut
 
 
-@pytest.fixture(scope="package")
+@pytest.fixture(scope="session")
 def Filter():
     yield SQLAlchemyFilter
 
 
-@pytest.fixture(scope="package")
+@pytest.fixture(scope="session")
 def AddressFilter(Address, Filter):
     class AddressFilter(Filter):  # type: ignore[misc, valid-type]
         street__isnull: bool | None = None
@@ -323,7 +366,7 @@ def AddressFilter(Address, Filter):
     yield AddressFilter
 
 
-@pytest.fixture(scope="package")
+@pytest.fixture(scope="session")
 def UserFilter(User, Filter, AddressFilter, Address):
     class UserFilter(Filter):  # type: ignore[misc, valid-type]
         name: str | None = None
@@ -355,25 +398,25 @@ def UserFilter(User, Filter, AddressFilter, Address):
 
         class Constants(Filter.Constants):  # type: ignore[name-defined]
             model = User
-            search_model_fields = ["name"]
+            search_model_columns = [User.name]
             search_field_name = "search"
             ordering_lower_case_fields = ["name"]
             ordering_convert_str_to_int_fields = ["code"]
 
+        _CUSTOM_OR_TEMPLATE: ClassVar = or_(
+            User.name == bindparam("custom_value"),
+            Address.street == bindparam("custom_value"),
+            Address.city == bindparam("custom_value"),
+            Address.country == bindparam("custom_value"),
+        )
+
         def get_custom_filter(self, query, value):
-            return query.filter(
-                or_(
-                    self.Constants.model.name == value,
-                    Address.street == value,
-                    Address.city == value,
-                    Address.country == value,
-                )
-            )
+            return query.filter(self._CUSTOM_OR_TEMPLATE.params(custom_value=value))
 
     yield UserFilter
 
 
-@pytest.fixture(scope="package")
+@pytest.fixture(scope="session")
 def UserFilterByAlias(UserFilter, AddressFilter):
     class UserFilterByAlias(UserFilter):  # type: ignore[misc, valid-type]
         address: AddressFilter | None = FilterDepends(  # type: ignore[valid-type]
@@ -383,7 +426,7 @@ def UserFilterByAlias(UserFilter, AddressFilter):
     yield UserFilterByAlias
 
 
-@pytest.fixture(scope="package")
+@pytest.fixture(scope="session")
 def SportFilter(Sport, Filter):
     class SportFilter(Filter):  # type: ignore[misc, valid-type]
         name: str | None = Field(Query(description="Name of the sport", default=None))
@@ -401,7 +444,7 @@ def SportFilter(Sport, Filter):
     yield SportFilter
 
 
-@pytest.fixture(scope="package")
+@pytest.fixture(scope="session")
 def app(
     Address,
     FavoriteSport,
@@ -429,28 +472,34 @@ def app(
         user_filter: UserFilter = FilterDepends(UserFilter),  # type: ignore[valid-type]
         db: AsyncSession = Depends(get_db),
     ):
-        query = user_filter.filter(select(User).outerjoin(Address))  # type: ignore[attr-defined]
+        query = select(User).outerjoin(Address)
+        query = query.options(contains_eager(User.address), selectinload(User.favorite_sports))
+        query = user_filter.filter(query)  # type: ignore[attr-defined]
         result = await db.execute(query)
-        return result.scalars().unique().all()
+        return result.scalars().all()
 
     @app.get("/users-by-alias", response_model=list[UserOut])  # type: ignore[valid-type]
     async def get_users_by_alias(
         user_filter: UserFilter = FilterDepends(UserFilterByAlias, by_alias=True),  # type: ignore[valid-type]
         db: AsyncSession = Depends(get_db),
     ):
-        query = user_filter.filter(select(User).outerjoin(Address))  # type: ignore[attr-defined]
+        query = select(User).outerjoin(Address)
+        query = query.options(contains_eager(User.address), selectinload(User.favorite_sports))
+        query = user_filter.filter(query)  # type: ignore[attr-defined]
         result = await db.execute(query)
-        return result.scalars().unique().all()
+        return result.scalars().all()
 
     @app.get("/users_with_order_by", response_model=list[UserOut])  # type: ignore[valid-type]
     async def get_users_with_order_by(
         user_filter: UserFilterOrderBy = FilterDepends(UserFilterOrderBy),  # type: ignore[valid-type]
         db: AsyncSession = Depends(get_db),
     ):
-        query = user_filter.sort(select(User).outerjoin(Address))  # type: ignore[attr-defined]
+        query = select(User).outerjoin(Address)
+        query = query.options(contains_eager(User.address), selectinload(User.favorite_sports))
+        query = user_filter.sort(query)  # type: ignore[attr-defined]
         query = user_filter.filter(query)  # type: ignore[attr-defined]
         result = await db.execute(query)
-        return result.scalars().unique().all()
+        return result.scalars().all()
 
     @app.get("/users_with_no_order_by", response_model=list[UserOut])  # type: ignore[valid-type]
     async def get_users_with_no_order_by(
@@ -73,6 +73,50 @@ async def test_filter_deprecation_contains_and_icontains(session, Address, User,
     assert len(result.scalars().unique().all()) == expected_count
 
 
+@pytest.mark.usefixtures("users")
+@pytest.mark.asyncio
+async def test_filter_search_by_model_field_names(session, User, Filter):
+    class UserSearchFilter(Filter):  # type: ignore[misc, valid-type]
+        search: str | None = None
+
+        class Constants(Filter.Constants):  # type: ignore[name-defined]
+            model = User
+            search_model_fields = ["name"]
+
+    query = UserSearchFilter(search="mr").filter(select(User))
+    result = await session.execute(query)
+    assert len(result.scalars().all()) == 2
+
+
+@pytest.mark.usefixtures("users")
+@pytest.mark.asyncio
+async def test_filter_search_subclass_overrides_inherited_columns(session, User, UserFilter):
+    class UserSearchByCodeFilter(UserFilter):  # type: ignore[misc, valid-type]
+        class Constants(UserFilter.Constants):  # type: ignore[name-defined]
+            search_model_fields = ["code"]
+
+    query = UserSearchByCodeFilter(search="1").filter(select(User))
+    result = await session.execute(query)
+    assert len(result.scalars().all()) == 4
+
+
+@pytest.mark.parametrize("search,expected_count", [["mr", 2], ["1", 0]])
+@pytest.mark.usefixtures("users")
+@pytest.mark.asyncio
+async def test_filter_search_columns_win_over_fields(session, User, Filter, search, expected_count):
+    class UserSearchFilter(Filter):  # type: ignore[misc, valid-type]
+        search: str | None = None
+
+        class Constants(Filter.Constants):  # type: ignore[name-defined]
+            model = User
+            search_model_fields = ["code"]
+            search_model_columns = [User.name]
+
+    query = UserSearchFilter(search=search).filter(select(User))
+    result = await session.execute(query)
+    assert len(result.scalars().all()) == expected_count
+
+
 @pytest.mark.parametrize("uri", ["/users", "/users-by-alias"])
 @pytest.mark.parametrize(
     "filter_,expected_count",